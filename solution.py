@@ -1,52 +1,93 @@
 import re
+import io
+import csv
 import random
-import psycopg2
+import threading
+from bisect import bisect_left
+from psycopg2 import pool
 from collections import Counter
 import statistics
 import math
-from bs4 import BeautifulSoup 
+from functools import lru_cache
+from lxml import etree
+
+# Splits a comma separated colour list, swallowing surrounding whitespace
+_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# PostgreSQL connection pools, shared across calls and keyed by the full
+# connection settings so different credentials never share a pool
+_PG_POOLS = {}
+_PG_POOLS_LOCK = threading.Lock()
+
+def _get_pool(dbname, user, password, host):
+    """Return the shared connection pool for the given connection settings"""
+    key = (dbname, user, password, host)
+    # Hold the lock while creating so concurrent first calls build one pool
+    with _PG_POOLS_LOCK:
+        if key not in _PG_POOLS:
+            _PG_POOLS[key] = pool.ThreadedConnectionPool(
+                1, 8, dbname=dbname, user=user, password=password, host=host
+            )
+        return _PG_POOLS[key]
+
+def _fib(n):
+    """Return (F(n), F(n + 1)) using fast doubling in O(log n) steps"""
+    if n == 0:
+        return (0, 1)
+    a, b = _fib(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    return (c, d) if n & 1 == 0 else (d, c + d)
 
 class BincomPythonTest:
+    # Known typos in the source data and their corrections
+    _TYPO_FIX = {"BLEW": "BLUE", "ARSH": "ASH"}
+    
     def __init__(self, html_file=None):
         self.html_file = html_file
-        self.colors = []
         self.color_counter = None
+        self._total = 0
         
     def load_data(self):
         """Load color data from HTML file or use hardcoded data if file not available"""
+        # Extractors count colors row by row into the counter as they parse
+        self.color_counter = Counter()
         if self.html_file:
             try:
-                self.colors = self.extract_colors_from_file(self.html_file)
+                self.extract_colors_from_file(self.html_file, self.color_counter)
             except Exception as e:
                 print(f"Error loading from file: {e}")
                 print("Falling back to hardcoded data...")
-                self.colors = self.extract_colors_from_hardcoded()
+                # Discard any rows counted before the failure
+                self.color_counter = Counter()
+                self.extract_colors_from_hardcoded(self.color_counter)
         else:
-            self.colors = self.extract_colors_from_hardcoded()
+            self.extract_colors_from_hardcoded(self.color_counter)
             
-        # Calculate color frequencies once
-        self.color_counter = Counter(self.colors)
-        return len(self.colors)
-        
-    def extract_colors_from_file(self, file_path):
-        """Extract colors from an HTML file"""
-        with open(file_path, 'r') as file:
-            html_content = file.read()
+        self._total = sum(self.color_counter.values())
+        return self._total
+        
+    def extract_colors_from_file(self, file_path, counter):
+        """Count colors from an HTML file into counter"""
+        # Stream rows with lxml's C parser rather than buffering the whole file
+        context = etree.iterparse(file_path, tag='tr', html=True, recover=True)
+        
+        for _, tr in context:
+            tds = tr.findall('td')
+            # Only day rows have exactly a day cell and a colours cell
+            if len(tds) == 2:
+                # Split colors and clean them
+                counter.update(self._clean_colors(_SPLIT_RE.split(''.join(tds[1].itertext()).strip())))
             
-        # Use regex to extract color data from HTML
-        pattern = r'<tr>\s*<td>([A-Z]+)</td>\s*<td>(.*?)</td>\s*</tr>'
-        matches = re.findall(pattern, html_content, re.DOTALL)
-        
-        all_colors = []
-        for day, colors_str in matches:
-            # Split colors and clean them
-            colors = [color.strip() for color in colors_str.split(',')]
-            all_colors.extend(colors)
+            # Free the parsed row and any earlier siblings to keep memory flat
+            tr.clear()
+            while tr.getprevious() is not None:
+                del tr.getparent()[0]
         
-        return self._clean_colors(all_colors)
+        return counter
     
-    def extract_colors_from_hardcoded(self):
-        """Extract colors from hardcoded data"""
+    def extract_colors_from_hardcoded(self, counter):
+        """Count colors from hardcoded data into counter"""
         color_data = {
             "MONDAY": "GREEN, YELLOW, GREEN, BROWN, BLUE, PINK, BLUE, YELLOW, ORANGE, CREAM, ORANGE, RED, WHITE, BLUE, WHITE, BLUE, BLUE, BLUE, GREEN",
             "TUESDAY": "ARSH, BROWN, GREEN, BROWN, BLUE, BLUE, BLEW, PINK, PINK, ORANGE, ORANGE, RED, WHITE, BLUE, WHITE, WHITE, BLUE, BLUE, BLUE",
@@ -55,27 +96,17 @@ class BincomPythonTest:
             "FRIDAY": "GREEN, WHITE, GREEN, BROWN, BLUE, BLUE, BLACK, WHITE, ORANGE, RED, RED, RED, WHITE, BLUE, WHITE, BLUE, BLUE, BLUE, WHITE"
         }
         
-        all_colors = []
         for day, colors_str in color_data.items():
-            colors = [color.strip() for color in colors_str.split(',')]
-            all_colors.extend(colors)
+            counter.update(self._clean_colors(_SPLIT_RE.split(colors_str.strip())))
         
-        return self._clean_colors(all_colors)
+        return counter
     
     def _clean_colors(self, color_list):
-        """Clean color data by fixing typos and removing blank entries"""
-        cleaned_colors = []
-        for color in color_list:
-            # Fix known typos
-            if color == "BLEW":
-                color = "BLUE"
-            elif color == "ARSH":
-                color = "ASH"
-            # Skip empty strings
-            if color:
-                cleaned_colors.append(color)
-        
-        return cleaned_colors
+        """
+        Clean color data by fixing typos and removing blank entries
+        Returns a single-use iterator over the cleaned colors, not a list
+        """
+        return (self._TYPO_FIX.get(color, color) for color in color_list if color)
     
     def get_most_common_color(self):
         """Find the color worn most throughout the week"""
@@ -84,83 +115,84 @@ class BincomPythonTest:
     
     def get_mean_color(self):
         """Find the mean color based on frequencies"""
-        total_colors = len(self.colors)
+        total_colors = self._total
         unique_colors = len(self.color_counter)
         mean_frequency = total_colors / unique_colors
         
-        closest_color = None
-        min_diff = float('inf')
-        
-        for color, freq in self.color_counter.items():
-            diff = abs(freq - mean_frequency)
-            if diff < min_diff:
-                min_diff = diff
-                closest_color = color
+        # Color whose frequency is closest to the mean (first one wins ties)
+        closest_color, _ = min(
+            self.color_counter.items(),
+            key=lambda item: abs(item[1] - mean_frequency)
+        )
         
         return closest_color, mean_frequency
     
     def get_median_color(self):
         """Find the median color"""
-        # Get all colors expanded by their frequencies
-        expanded_colors = []
-        for color, freq in self.color_counter.items():
-            expanded_colors.extend([color] * freq)
-        
-        # Sort colors alphabetically to break ties consistently
-        expanded_colors.sort()
-        
-        # Find the middle color
-        n = len(expanded_colors)
-        middle_idx = n // 2
-        return expanded_colors[middle_idx]
+        # Index of the middle color in the alphabetically sorted expansion
+        middle_idx = self._total // 2
+        
+        # Walk unique colors alphabetically, accumulating their frequencies
+        # until the running count passes the middle index
+        cumulative = 0
+        for color, freq in sorted(self.color_counter.items()):
+            cumulative += freq
+            if cumulative > middle_idx:
+                return color
+        
+        # Only reached with no colors, where the old expand-and-index lookup
+        # also failed with IndexError
+        raise IndexError("median of empty color data")
     
     def get_color_variance(self):
         """Calculate variance of color frequencies"""
-        frequencies = list(self.color_counter.values())
+        # statistics accepts the values view directly, no list copy needed
+        frequencies = self.color_counter.values()
         return statistics.variance(frequencies) if len(frequencies) > 1 else 0
     
     def get_color_probability(self, target_color):
         """Calculate probability of randomly selecting a specific color"""
         target_count = self.color_counter.get(target_color.upper(), 0)
-        return target_count / len(self.colors)
+        return target_count / self._total
     
     def save_to_postgresql(self, dbname, user, password, host="localhost"):
         """Save color frequency data to PostgreSQL database"""
         try:
-            # Connect to PostgreSQL
-            conn = psycopg2.connect(
+            # Borrow a connection from the shared PostgreSQL pool
+            pg_pool = _get_pool(
                 dbname=dbname,
                 user=user,
                 password=password,
                 host=host
             )
+            conn = pg_pool.getconn()
             
-            # Create a cursor
-            cur = conn.cursor()
-            
-            # Create table if it doesn't exist
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS color_frequencies (
-                    id SERIAL PRIMARY KEY,
-                    color VARCHAR(50) NOT NULL,
-                    frequency INTEGER NOT NULL
-                )
-            """)
-            
-            # Clear existing data
-            cur.execute("DELETE FROM color_frequencies")
-            
-            # Insert color frequencies
-            for color, freq in self.color_counter.items():
-                cur.execute(
-                    "INSERT INTO color_frequencies (color, frequency) VALUES (%s, %s)",
-                    (color, freq)
-                )
-            
-            # Commit and close
-            conn.commit()
-            cur.close()
-            conn.close()
+            try:
+                # Run every statement in one transaction: the connection
+                # block commits once on success and rolls back on error
+                with conn, conn.cursor() as cur:
+                    # Create table if it doesn't exist
+                    cur.execute("""
+                        CREATE TABLE IF NOT EXISTS color_frequencies (
+                            id SERIAL PRIMARY KEY,
+                            color VARCHAR(50) NOT NULL,
+                            frequency INTEGER NOT NULL
+                        )
+                    """)
+                    
+                    # Clear existing data
+                    cur.execute("TRUNCATE color_frequencies RESTART IDENTITY")
+                    
+                    # Bulk load color frequencies through COPY from an in-memory CSV
+                    buf = io.StringIO()
+                    csv.writer(buf, lineterminator='\n').writerows(self.color_counter.items())
+                    buf.seek(0)
+                    cur.copy_expert(
+                        "COPY color_frequencies (color, frequency) FROM STDIN WITH CSV",
+                        buf
+                    )
+            finally:
+                pg_pool.putconn(conn)
             
             return True
         except Exception as e:
@@ -170,60 +202,43 @@ class BincomPythonTest:
     @staticmethod
     def recursive_search(numbers, target, start=0, end=None):
         """
-        Recursive searching algorithm to search for a number in a list
-        Uses binary search algorithm for efficiency
+        Searching algorithm to search for a number in a list
+        Uses binary search algorithm for efficiency, delegating the
+        halving loop to the C-coded bisect module
+        The name is kept for compatibility; the search no longer recurses
         """
         if end is None:
             end = len(numbers) - 1
         
-        # Base case: empty list or sublist
-        if start > end:
-            return -1
-        
-        # Find middle index
-        mid = (start + end) // 2
-        
-        # Check if middle element is the target
-        if numbers[mid] == target:
-            return mid
+        # Leftmost insertion point for target within numbers[start:end + 1]
+        idx = bisect_left(numbers, target, start, max(start, end + 1))
         
-        # If target is smaller, search left sublist
-        if numbers[mid] > target:
-            return BincomPythonTest.recursive_search(numbers, target, start, mid - 1)
+        # Found only if the element at the insertion point is the target
+        if idx <= end and numbers[idx] == target:
+            return idx
         
-        # If target is larger, search right sublist
-        return BincomPythonTest.recursive_search(numbers, target, mid + 1, end)
+        return -1
     
     @staticmethod
     def generate_binary_and_convert():
         """Generate random 4-digit binary number and convert to base 10"""
-        # Generate 4 random binary digits
-        binary_digits = [random.choice(['0', '1']) for _ in range(4)]
-        binary_str = ''.join(binary_digits)
+        # Draw 4 random bits directly as an integer
+        decimal_value = random.getrandbits(4)
         
-        # Convert to base 10
-        decimal_value = int(binary_str, 2)
+        # Format as a zero-padded 4-digit binary string
+        binary_str = f"{decimal_value:04b}"
         
         return binary_str, decimal_value
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def sum_fibonacci(n=50):
         """Calculate sum of first n Fibonacci numbers"""
         if n <= 0:
             return 0
         
-        # Initialize first two Fibonacci numbers
-        a, b = 0, 1
-        total_sum = b  # Start with F(1) = 1
-        
-        # Generate the Fibonacci sequence and sum
-        for i in range(2, n+1):
-            # Calculate next Fibonacci number
-            a, b = b, a + b
-            # Add to sum
-            total_sum += b
-        
-        return total_sum
+        # F(1) + F(2) + ... + F(n) == F(n + 2) - 1
+        return _fib(n + 2)[0] - 1
     
     def run_analysis(self):
         """Run all analysis tasks and print results"""
@@ -235,7 +250,7 @@ class BincomPythonTest:
         
         # Show color distribution
         print("\nColor distribution:")
-        for color, count in sorted(self.color_counter.items(), key=lambda x: x[1], reverse=True):
+        for color, count in self.color_counter.most_common():
             print(f"  {color}: {count}")
         
         print("\n=== Key Features Results ===")
@@ -265,8 +280,8 @@ class BincomPythonTest:
         success = self.save_to_postgresql("colour", "postgres", "Alliekundayo65")
         print(f"   {'Success!' if success else 'Failed to save to database.'}")
         
-        # 7. Demonstrate recursive search algorithm
-        print("\n7. Recursive search algorithm demonstration:")
+        # 7. Demonstrate binary search algorithm
+        print("\n7. Binary search algorithm demonstration:")
         demo_list = sorted([13, 42, 7, 29, 56, 81, 23, 36, 91, 5])
         search_num = 29
         result = self.recursive_search(demo_list, search_num)
@@ -293,14 +308,13 @@ def analyze_binary_sequence_puzzle():
     
     print("\nRule analysis: For every 1s that appear 3 times consecutively, the output will be 1, otherwise 0.")
     
-    # Verify the rule
-    calculated_output = ""
-    for i in range(len(input_sequence) - 2):
-        window = input_sequence[i:i+3]
-        if window == "111":
-            calculated_output += "1"
-        else:
-            calculated_output += "0"
+    # Verify the rule: treat the sequence as an integer and AND it with
+    # itself shifted by one and two bits, so a bit stays set only where
+    # it starts a run of three 1s
+    n = len(input_sequence)
+    x = int(input_sequence, 2)
+    mask = x & (x >> 1) & (x >> 2)
+    calculated_output = format(mask, f"0{n - 2}b")
     
     # Add zeroes at the end to match length (since we're using a 3-character window)
     calculated_output += "0" * 2